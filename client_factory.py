@@ -0,0 +1,73 @@
+"""
+OpenAI Tutorial - Shared Client Factory
+Provides a single OpenAI client backed by a pooled httpx.Client so all
+modules reuse the same TLS connections instead of each paying the
+TCP+TLS handshake cost per call
+"""
+
+import os
+import atexit
+import httpx
+from functools import lru_cache
+from dotenv import load_dotenv
+from openai import OpenAI
+
+# Load environment variables once for the whole process; every other
+# module reaches the key through this module instead of re-parsing .env.
+# Caching the key here also keeps it stable if .env changes mid-process
+load_dotenv()
+API_KEY = os.getenv('OPENAI_API_KEY')
+
+# Connection pool settings shared by every client in this tutorial
+POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=30.0
+)
+# Bound connection setup separately so a stalled handshake fails fast
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Retries with exponential backoff (handled by the SDK) smooth over
+# transient 429s and connection resets instead of failing the call
+MAX_RETRIES = 5
+
+
+def build_http_client() -> httpx.Client:
+    """
+    Build a pooled httpx.Client and register it for cleanup at exit
+
+    Returns:
+        A httpx.Client with keep-alive connection pooling enabled
+    """
+    # http2=True lets concurrent requests multiplex over one TLS
+    # connection instead of opening a socket each (needs httpx[http2])
+    http_client = httpx.Client(http2=True, limits=POOL_LIMITS, timeout=DEFAULT_TIMEOUT)
+    atexit.register(http_client.close)
+    return http_client
+
+
+def build_async_http_client() -> httpx.AsyncClient:
+    """
+    Build a pooled httpx.AsyncClient for use with AsyncOpenAI
+
+    The caller owns the client and should close it with `await aclose()`
+
+    Returns:
+        A httpx.AsyncClient with keep-alive connection pooling enabled
+    """
+    return httpx.AsyncClient(http2=True, limits=POOL_LIMITS, timeout=DEFAULT_TIMEOUT)
+
+
+@lru_cache(maxsize=1)
+def get_client() -> OpenAI:
+    """
+    Get the shared OpenAI client, created once per process
+
+    Returns:
+        The singleton OpenAI client with pooled connections
+    """
+    return OpenAI(
+        api_key=API_KEY,
+        http_client=build_http_client(),
+        max_retries=MAX_RETRIES
+    )
@@ -0,0 +1,72 @@
+"""
+OpenAI Tutorial - Simple Disk Cache
+Content-addressed on-disk cache used to skip repeat API calls for
+identical inputs. Keys are hashed with BLAKE2 and values stored as one
+JSON file per entry, so a warm lookup is a local file read instead of a
+network round-trip
+"""
+
+import json
+import time
+import hashlib
+from pathlib import Path
+from typing import Any, Optional
+
+
+class DiskCache:
+    """
+    A minimal content-addressed cache storing JSON values on disk
+    """
+
+    def __init__(self, directory: str, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the cache
+
+        Args:
+            directory: Directory to store cache entries in (created if missing)
+            ttl_seconds: Optional entry lifetime; expired entries are treated as misses
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+
+    def _path(self, key: str) -> Path:
+        """Map a cache key to its file path via a BLAKE2 digest"""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached value, or None on a miss or expired entry
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if self.ttl_seconds is not None and time.time() - entry['stored_at'] > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+
+        return entry['value']
+
+    def set(self, key: str, value: Any):
+        """
+        Store a value under the given key
+
+        Args:
+            key: The cache key
+            value: Any JSON-serializable value
+        """
+        path = self._path(key)
+        entry = {'stored_at': time.time(), 'value': value}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
@@ -1,13 +1,8 @@
-import os
 from typing import Optional, List, Dict, Any
-from dotenv import load_dotenv
-from openai import OpenAI
+from client_factory import get_client
 
-# Load environment variables
-load_dotenv()
-
-# Initialize OpenAI client with API key
-client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+# Shared OpenAI client with pooled connections
+client = get_client()
 
 # Function to be called from main.py
 def run_example1():
@@ -1,34 +1,39 @@
-from openai import OpenAI
-import os
-from dotenv import load_dotenv
+from client_factory import get_client
 
-# Load environment variables
-load_dotenv()
+# Shared OpenAI client with pooled connections
+client = get_client()
 
-# Initialize client with API key
-client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
 
-# Using instruction in the response creation
-response = client.responses.create(
-    model="gpt-5-nano",
-    reasoning={"effort": "low"},
-    instructions="Talk like a pirate.",
-    input="Are semicolons optional in JavaScript?",
-)
-print(response.output_text)
+def with_instructions():
+    """Use the instructions parameter in the response creation"""
+    response = client.responses.create(
+        model="gpt-5-nano",
+        reasoning={"effort": "low"},
+        instructions="Talk like a pirate.",
+        input="Are semicolons optional in JavaScript?",
+    )
+    print(response.output_text)
 
-#put instruction inside input array as Developer role and user question as User role
-response = client.responses.create(
-    model="gpt-5-nano",
-    reasoning={"effort": "low"},
-    input=[
- {
-            "role": "developer",
-            "content": "Talk like a pirate."
-        },
-{"role": "user", 
- "content": "Are semicolons optional in JavaScript?"}
 
-    ]
-)   
-print(response.output_text)
+def with_developer_role():
+    """Put the instruction inside the input array as Developer role and the question as User role"""
+    response = client.responses.create(
+        model="gpt-5-nano",
+        reasoning={"effort": "low"},
+        input=[
+            {
+                "role": "developer",
+                "content": "Talk like a pirate."
+            },
+            {
+                "role": "user",
+                "content": "Are semicolons optional in JavaScript?"
+            }
+        ]
+    )
+    print(response.output_text)
+
+
+if __name__ == "__main__":
+    with_instructions()
+    with_developer_role()
@@ -0,0 +1,35 @@
+from client_factory import get_client
+
+# Shared OpenAI client with pooled connections
+client = get_client()
+
+# The stored prompt id/version never changes per call, so build it once at
+# module level; only the variables are substituted per request. This keeps
+# dict construction off the hot path and avoids accidental mutation when the
+# call runs inside a loop or web handler
+PROMPT_TEMPLATE = {"id": "pmpt_6910f04c", "version": "2"}
+
+
+def run_reusable_prompt(customer_name: str, product: str) -> str:
+    """
+    Call the stored reusable prompt with per-call variables
+
+    Args:
+        customer_name: Value for the prompt's customer_name variable
+        product: Value for the prompt's product variable
+
+    Returns:
+        The response text
+    """
+    response = client.responses.create(
+        model="gpt-5-nano",
+        prompt={
+            **PROMPT_TEMPLATE,
+            "variables": {"customer_name": customer_name, "product": product}
+        }
+    )
+    return response.output_text
+
+
+if __name__ == "__main__":
+    print(run_reusable_prompt("Ada", "OpenAI API starter kit"))
@@ -4,11 +4,32 @@ Object-oriented implementation demonstrating basic OpenAI SDK usage
 """
 
 import os
-from typing import List, Optional, Dict, Any
-from dotenv import load_dotenv
-from openai import OpenAI
+import sys
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from typing import List, Optional, Dict, Any, Iterator, Union
+from openai import OpenAI, AsyncOpenAI, RateLimitError
+from client_factory import API_KEY, get_client, build_http_client, build_async_http_client, MAX_RETRIES
+from disk_cache import DiskCache
 from example1 import run_example1
 
+# Diagnostics go through logging (buffered, level-filterable) so print
+# is reserved for user-facing output
+log = logging.getLogger(__name__)
+
+# Model tiers trade quality for latency and cost; demos default to the
+# cheapest tier since their output only needs to illustrate the API
+MODEL_TIERS = {
+    "fast": {"chat": "gpt-4o-mini", "image": "dall-e-2"},
+    "balanced": {"chat": "gpt-4o-mini", "image": "dall-e-3"},
+    "quality": {"chat": "gpt-4o", "image": "dall-e-3"}
+}
+
+
 class OpenAIClient:
     """
     A wrapper class for OpenAI API operations
@@ -21,66 +42,200 @@ class OpenAIClient:
         Args:
             api_key: Optional API key. If not provided, will load from environment
         """
-        # Load environment variables
-        load_dotenv()
-        
-        # Set API key
-        self.api_key = api_key or os.getenv('OPENAI_API_KEY')
+        # Set API key (.env is parsed once, when client_factory is imported)
+        self.api_key = api_key or API_KEY
         if not self.api_key:
             raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY in .env file")
-        
-        # Initialize OpenAI client
-        self.client = OpenAI(api_key=self.api_key)
-        
+
+        # Reuse the process-wide pooled client unless an explicit key was
+        # given, so all modules share one connection pool
+        if api_key is None:
+            self._httpx = None
+            self.client = get_client()
+        else:
+            self._httpx = build_http_client()
+            self.client = OpenAI(api_key=self.api_key, http_client=self._httpx, max_retries=MAX_RETRIES)
+
         # Default model settings
         self.default_model = "gpt-4o-mini"
         self.default_max_tokens = 150
         self.default_temperature = 0.7
-    
+
+        # On-disk embedding cache: identical (text, model) pairs are
+        # answered locally instead of paying the API round-trip again
+        self._emb_cache = DiskCache("./.embedcache", ttl_seconds=86400 * 30)
+
+        # On-disk chat cache, used only for temperature=0 requests where
+        # the completion is deterministic and safe to replay
+        self._chat_cache = DiskCache("./.chatcache")
+
+        # Prebuilt message prefix (session system prompt plus any
+        # accumulated history) reused across chat_completion calls
+        self._msg_prefix: List[Dict[str, str]] = []
+
+        # Warm up DNS + TCP + TLS off the critical path so the first real
+        # API call finds a hot connection in the pool
+        threading.Thread(target=self._warm_connection, daemon=True).start()
+
+    def _warm_connection(self):
+        """Issue a lightweight request to pre-establish the HTTPS connection"""
+        try:
+            self.client.models.list()
+        except Exception:
+            # Warmup is best-effort; the first real call just pays the
+            # handshake instead
+            log.debug("Connection warmup failed", exc_info=True)
+
+    def set_system_prompt(self, system_prompt: str):
+        """
+        Set a session-wide system prompt built once and reused on every call
+
+        Args:
+            system_prompt: The system prompt for this session
+        """
+        self._msg_prefix = [{"role": "system", "content": system_prompt}]
+
+    def add_to_history(self, role: str, content: str):
+        """
+        Append a turn to the reusable message prefix for multi-turn chats
+
+        Args:
+            role: The message role ("user" or "assistant")
+            content: The message text
+        """
+        self._msg_prefix.append({"role": role, "content": content})
+
+    def close(self):
+        """Release the HTTP connection pool if this instance owns one"""
+        if self._httpx is not None:
+            self._httpx.close()
+
     def chat_completion(
         self,
         message: str,
         model: Optional[str] = None,
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
-        system_prompt: Optional[str] = None
-    ) -> str:
+        system_prompt: Optional[str] = None,
+        service_tier: str = "auto",
+        stream: bool = False,
+        tier: Optional[str] = None,
+        stop: Optional[List[str]] = None
+    ) -> Union[str, Iterator[str]]:
         """
         Generate a chat completion using OpenAI's chat models
-        
+
+        Generation is autoregressive, so latency scales with output tokens;
+        a tight max_tokens and a stop sequence cut response time at the risk
+        of truncating long answers
+
         Args:
             message: The user message to send
             model: The model to use (default: gpt-3.5-turbo)
             max_tokens: Maximum tokens to generate
             temperature: Creativity level (0-1)
             system_prompt: Optional system prompt for context
-            
+            service_tier: Processing tier; "flex" trades latency for lower cost
+            stream: When True, return a generator of text chunks as they
+                arrive instead of waiting for the full response
+            tier: Optional model tier from MODEL_TIERS ("fast", "balanced",
+                "quality"); an explicit model takes precedence
+            stop: Optional stop sequences to end generation early
+
         Returns:
-            The generated response text
+            The generated response text, or an iterator of text chunks
+            when stream=True
         """
         try:
-            messages = []
-            
-            # Add system prompt if provided
+            # A per-call system prompt overrides the session prefix;
+            # otherwise reuse the prebuilt prefix instead of rebuilding it
             if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            
-            # Add user message
-            messages.append({"role": "user", "content": message})
-            
+                prefix = [{"role": "system", "content": system_prompt}]
+            else:
+                prefix = self._msg_prefix
+
+            messages = prefix + [{"role": "user", "content": message}]
+
+            resolved_model = model or (MODEL_TIERS[tier]["chat"] if tier else self.default_model)
+            resolved_max_tokens = max_tokens or self.default_max_tokens
+            resolved_temperature = temperature if temperature is not None else self.default_temperature
+
+            # Only temperature=0 responses are deterministic enough to replay
+            # from disk; check the cache before going to the network.
+            # Streamed calls skip the cache entirely so they always return
+            # an iterator of chunks, never a cached string
+            cache_key = None
+            if resolved_temperature == 0 and not stream:
+                # Key on the full messages list so the session prefix and
+                # accumulated history distinguish otherwise identical calls
+                cache_key = json.dumps(
+                    {"m": resolved_model, "msgs": messages,
+                     "t": resolved_temperature, "n": resolved_max_tokens,
+                     "x": stop},
+                    sort_keys=True
+                )
+                cached = self._chat_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+            request_kwargs = {
+                "model": resolved_model,
+                "messages": messages,
+                "max_tokens": resolved_max_tokens,
+                "temperature": resolved_temperature,
+                "service_tier": service_tier
+            }
+            if stop:
+                request_kwargs["stop"] = stop
+
+            # A stable key per system prompt lets the server cache the
+            # shared prefix, cutting input-token cost on repeat calls
+            if system_prompt:
+                request_kwargs["prompt_cache_key"] = hashlib.sha256(
+                    system_prompt.encode('utf-8')
+                ).hexdigest()[:32]
+
+            # Streamed responses bypass the cache and yield tokens as
+            # they arrive, so the first token is visible immediately
+            if stream:
+                request_kwargs["stream"] = True
+                return self._stream_chat(request_kwargs)
+
             # Make the API call
-            response = self.client.chat.completions.create(
-                model=model or self.default_model,
-                messages=messages,
-                max_tokens=max_tokens or self.default_max_tokens,
-                temperature=temperature or self.default_temperature
-            )
-            
-            return response.choices[0].message.content
-            
+            try:
+                response = self.client.chat.completions.create(**request_kwargs)
+            except RateLimitError:
+                # Flex capacity can be temporarily unavailable; retry
+                # once at standard priority
+                if service_tier != "flex":
+                    raise
+                request_kwargs["service_tier"] = "auto"
+                response = self.client.chat.completions.create(**request_kwargs)
+
+            text = response.choices[0].message.content
+            if cache_key is not None:
+                self._chat_cache.set(cache_key, text)
+            return text
+
         except Exception as e:
             return f"Error generating response: {str(e)}"
-    
+
+    def _stream_chat(self, request_kwargs: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield response text chunks as the API streams them
+
+        Args:
+            request_kwargs: Keyword arguments for chat.completions.create
+                with stream=True already set
+        """
+        try:
+            for chunk in self.client.chat.completions.create(**request_kwargs):
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            yield f"Error generating response: {str(e)}"
+
     def generate_embeddings(self, text: str, model: str = "text-embedding-3-small") -> List[float]:
         """
         Generate embeddings for the given text
@@ -93,38 +248,104 @@ class OpenAIClient:
             List of embedding values
         """
         try:
+            # Check the on-disk cache first so repeated texts skip the API
+            cache_key = f"{model}:{text}"
+            cached = self._emb_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
             response = self.client.embeddings.create(
                 model=model,
                 input=text
             )
-            return response.data[0].embedding
-            
-        except Exception as e:
-            print(f"Error generating embeddings: {str(e)}")
+            embedding = response.data[0].embedding
+            self._emb_cache.set(cache_key, embedding)
+            return embedding
+
+        except Exception:
+            log.exception("Error generating embeddings")
             return []
-    
+
+    def generate_embeddings_batch(
+        self,
+        texts: List[str],
+        model: str = "text-embedding-3-small"
+    ) -> List[List[float]]:
+        """
+        Generate embeddings for multiple texts in a single API call
+
+        The embeddings endpoint accepts an array input, so N texts cost one
+        round-trip instead of N. Duplicate texts are collapsed and cached
+        embeddings are reused, so only distinct cache misses are sent to the
+        API. Inputs are chunked to the API's 2048-items per request cap and
+        results are returned in input order
+
+        Args:
+            texts: The texts to generate embeddings for
+            model: The embedding model to use
+
+        Returns:
+            List of embedding vectors, one per input text
+        """
+        try:
+            # Deduplicate while preserving first-seen order
+            unique_texts = list(dict.fromkeys(texts))
+
+            # Serve whatever we can from the on-disk cache
+            resolved = {}
+            missing = []
+            for text in unique_texts:
+                cached = self._emb_cache.get(f"{model}:{text}")
+                if cached is not None:
+                    resolved[text] = cached
+                else:
+                    missing.append(text)
+
+            # Fetch only the cache misses; the API accepts at most 2048
+            # inputs per request
+            for start in range(0, len(missing), 2048):
+                chunk = missing[start:start + 2048]
+                response = self.client.embeddings.create(
+                    model=model,
+                    input=chunk
+                )
+                # response.data is ordered by input index
+                for text, item in zip(chunk, response.data):
+                    resolved[text] = item.embedding
+                    self._emb_cache.set(f"{model}:{text}", item.embedding)
+
+            # Scatter results back to the original positions
+            return [resolved[text] for text in texts]
+
+        except Exception:
+            log.exception("Error generating embeddings")
+            return []
+
     def generate_image(
         self,
         prompt: str,
         size: str = "1024x1024",
         quality: str = "standard",
-        n: int = 1
+        n: int = 1,
+        tier: Optional[str] = None
     ) -> List[str]:
         """
         Generate images using DALL-E
-        
+
         Args:
             prompt: Description of the image to generate
             size: Image size (256x256, 512x512, 1024x1024)
             quality: Image quality (standard, hd)
             n: Number of images to generate
-            
+            tier: Optional model tier from MODEL_TIERS ("fast", "balanced",
+                "quality"); defaults to dall-e-3
+
         Returns:
             List of image URLs
         """
         try:
             response = self.client.images.generate(
-                model="dall-e-3",
+                model=MODEL_TIERS[tier]["image"] if tier else "dall-e-3",
                 prompt=prompt,
                 size=size,
                 quality=quality,
@@ -133,8 +354,181 @@ class OpenAIClient:
             
             return [image.url for image in response.data]
             
+        except Exception:
+            log.exception("Error generating image")
+            return []
+
+
+class AsyncOpenAIClient:
+    """
+    Async wrapper class for OpenAI API operations
+
+    Mirrors OpenAIClient but uses AsyncOpenAI so independent calls can
+    run concurrently with asyncio.gather instead of back-to-back
+    """
+
+    def __init__(self, api_key: Optional[str] = None):
+        """
+        Initialize the async OpenAI client
+
+        Args:
+            api_key: Optional API key. If not provided, will load from environment
+        """
+        # Set API key (.env is parsed once, when client_factory is imported)
+        self.api_key = api_key or API_KEY
+        if not self.api_key:
+            raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY in .env file")
+
+        # Initialize async OpenAI client with a pooled httpx transport so
+        # concurrent requests share the same connection pool
+        self._httpx = build_async_http_client()
+        self.client = AsyncOpenAI(api_key=self.api_key, http_client=self._httpx, max_retries=MAX_RETRIES)
+
+        # Default model settings
+        self.default_model = "gpt-4o-mini"
+        self.default_max_tokens = 150
+        self.default_temperature = 0.7
+
+    async def aclose(self):
+        """Release the underlying HTTP connection pool"""
+        await self._httpx.aclose()
+
+    async def chat_completion(
+        self,
+        message: str,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_prompt: Optional[str] = None,
+        service_tier: str = "auto",
+        tier: Optional[str] = None
+    ) -> str:
+        """
+        Generate a chat completion using OpenAI's chat models
+
+        Args:
+            message: The user message to send
+            model: The model to use (default: gpt-4o-mini)
+            max_tokens: Maximum tokens to generate
+            temperature: Creativity level (0-1)
+            system_prompt: Optional system prompt for context
+            service_tier: Processing tier; "flex" trades latency for lower cost
+            tier: Optional model tier from MODEL_TIERS ("fast", "balanced",
+                "quality"); an explicit model takes precedence
+
+        Returns:
+            The generated response text
+        """
+        try:
+            messages = []
+
+            # Add system prompt if provided
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+
+            # Add user message
+            messages.append({"role": "user", "content": message})
+
+            request_kwargs = {
+                "model": model or (MODEL_TIERS[tier]["chat"] if tier else self.default_model),
+                "messages": messages,
+                "max_tokens": max_tokens or self.default_max_tokens,
+                "temperature": temperature if temperature is not None else self.default_temperature,
+                "service_tier": service_tier
+            }
+
+            # A stable key per system prompt lets the server cache the
+            # shared prefix, cutting input-token cost on repeat calls
+            if system_prompt:
+                request_kwargs["prompt_cache_key"] = hashlib.sha256(
+                    system_prompt.encode('utf-8')
+                ).hexdigest()[:32]
+
+            # Make the API call
+            try:
+                response = await self.client.chat.completions.create(**request_kwargs)
+            except RateLimitError:
+                # Flex capacity can be temporarily unavailable; retry
+                # once at standard priority
+                if service_tier != "flex":
+                    raise
+                request_kwargs["service_tier"] = "auto"
+                response = await self.client.chat.completions.create(**request_kwargs)
+
+            return response.choices[0].message.content
+
         except Exception as e:
-            print(f"Error generating image: {str(e)}")
+            return f"Error generating response: {str(e)}"
+
+    async def generate_embeddings(self, text: str, model: str = "text-embedding-3-small") -> List[float]:
+        """
+        Generate embeddings for the given text
+
+        Args:
+            text: The text to generate embeddings for
+            model: The embedding model to use
+
+        Returns:
+            List of embedding values
+        """
+        try:
+            response = await self.client.embeddings.create(
+                model=model,
+                input=text
+            )
+            return response.data[0].embedding
+
+        except Exception:
+            log.exception("Error generating embeddings")
+            return []
+
+    async def generate_image(
+        self,
+        prompt: str,
+        size: str = "1024x1024",
+        quality: str = "standard",
+        n: int = 1,
+        tier: Optional[str] = None
+    ) -> List[str]:
+        """
+        Generate images using DALL-E
+
+        dall-e-3 only accepts n=1 per request, so multiple images are
+        produced as concurrent single-image calls; wall time is roughly one
+        round-trip instead of n
+
+        Args:
+            prompt: Description of the image to generate
+            size: Image size (256x256, 512x512, 1024x1024)
+            quality: Image quality (standard, hd)
+            n: Number of images to generate
+            tier: Optional model tier from MODEL_TIERS ("fast", "balanced",
+                "quality"); defaults to dall-e-3
+
+        Returns:
+            List of image URLs
+        """
+        try:
+            resolved_model = MODEL_TIERS[tier]["image"] if tier else "dall-e-3"
+
+            # Bound in-flight requests so a large n doesn't trip rate limits
+            semaphore = asyncio.Semaphore(5)
+
+            async def generate_one():
+                async with semaphore:
+                    return await self.client.images.generate(
+                        model=resolved_model,
+                        prompt=prompt,
+                        size=size,
+                        quality=quality,
+                        n=1
+                    )
+
+            responses = await asyncio.gather(*[generate_one() for _ in range(n)])
+            return [response.data[0].url for response in responses]
+
+        except Exception:
+            log.exception("Error generating image")
             return []
 
 
@@ -150,34 +544,51 @@ class OpenAITutorial:
         print("-" * 50)
     
     def demo_chat_completion(self):
-        """Demonstrate basic chat completion"""
+        """
+        Demonstrate basic chat completion
+
+        Demo answers are short, so max_tokens is capped at 80 and a
+        blank-line stop sequence ends verbose responses early; both cut
+        generation latency at the cost of truncating long answers
+        """
         print("\n🤖 Chat Completion Demo")
         print("-" * 30)
-        
+
         # Simple conversation
-        response = self.ai_client.chat_completion("Hello! Tell me a fun fact about Python programming.")
+        response = self.ai_client.chat_completion(
+            "Hello! Tell me a fun fact about Python programming.",
+            tier="fast",
+            max_tokens=80,
+            stop=["\n\n"]
+        )
         print(f"AI Response: {response}")
-        
+
         # With system prompt
         system_prompt = "You are a helpful coding assistant. Keep responses concise and practical."
         response = self.ai_client.chat_completion(
             "How do I create a virtual environment in Python?",
-            system_prompt=system_prompt
+            system_prompt=system_prompt,
+            max_tokens=80
         )
         print(f"\nAI Response (with system prompt): {response}")
     
     def demo_embeddings(self):
-        """Demonstrate text embeddings"""
+        """Demonstrate text embeddings with a single batched API call"""
         print("\n📊 Text Embeddings Demo")
         print("-" * 30)
-        
-        text = "OpenAI provides powerful AI models for developers"
-        embeddings = self.ai_client.generate_embeddings(text)
-        
+
+        texts = [
+            "OpenAI provides powerful AI models for developers",
+            "Embeddings turn text into vectors for semantic search"
+        ]
+        # One API call for all texts instead of one call each
+        embeddings = self.ai_client.generate_embeddings_batch(texts)
+
         if embeddings:
-            print(f"Text: {text}")
-            print(f"Embedding vector length: {len(embeddings)}")
-            print(f"First 5 values: {embeddings[:5]}")
+            for text, embedding in zip(texts, embeddings):
+                print(f"Text: {text}")
+                print(f"Embedding vector length: {len(embedding)}")
+                print(f"First 5 values: {embedding[:5]}")
         else:
             print("Failed to generate embeddings")
     
@@ -189,7 +600,7 @@ class OpenAITutorial:
         prompt = "A serene mountain landscape with a crystal clear lake, digital art style"
         print(f"Generating image with prompt: {prompt}")
         
-        image_urls = self.ai_client.generate_image(prompt)
+        image_urls = self.ai_client.generate_image(prompt, tier="fast")
         
         if image_urls:
             print(f"Generated {len(image_urls)} image(s):")
@@ -198,6 +609,186 @@ class OpenAITutorial:
         else:
             print("Failed to generate image")
     
+    async def demo_chat_completion_async(self, ai_client: AsyncOpenAIClient):
+        """Async variant of the chat completion demo"""
+        # service_tier="flex" stays opt-in here: flex is only available on
+        # o-series/gpt-5-family models, and this demo uses gpt-4o-mini
+        response = await ai_client.chat_completion(
+            "Hello! Tell me a fun fact about Python programming.",
+            max_tokens=80
+        )
+        print("\n🤖 Chat Completion Demo")
+        print("-" * 30)
+        print(f"AI Response: {response}")
+
+    async def demo_embeddings_async(self, ai_client: AsyncOpenAIClient):
+        """Async variant of the embeddings demo"""
+        text = "OpenAI provides powerful AI models for developers"
+        embeddings = await ai_client.generate_embeddings(text)
+
+        print("\n📊 Text Embeddings Demo")
+        print("-" * 30)
+        if embeddings:
+            print(f"Text: {text}")
+            print(f"Embedding vector length: {len(embeddings)}")
+            print(f"First 5 values: {embeddings[:5]}")
+        else:
+            print("Failed to generate embeddings")
+
+    async def demo_image_generation_async(self, ai_client: AsyncOpenAIClient):
+        """Async variant of the image generation demo"""
+        prompt = "A serene mountain landscape with a crystal clear lake, digital art style"
+        image_urls = await ai_client.generate_image(prompt, tier="fast")
+
+        print("\n🎨 Image Generation Demo")
+        print("-" * 30)
+        print(f"Generated image with prompt: {prompt}")
+        if image_urls:
+            print(f"Generated {len(image_urls)} image(s):")
+            for i, url in enumerate(image_urls, 1):
+                print(f"Image {i}: {url}")
+        else:
+            print("Failed to generate image")
+
+    async def run_demos_concurrently(self):
+        """
+        Run the three demos concurrently with asyncio.gather
+
+        The demos are independent network calls, so total wall time is the
+        slowest single demo instead of the sum of all three
+        """
+        ai_client = AsyncOpenAIClient()
+        try:
+            await asyncio.gather(
+                self.demo_chat_completion_async(ai_client),
+                self.demo_embeddings_async(ai_client),
+                self.demo_image_generation_async(ai_client)
+            )
+        finally:
+            await ai_client.aclose()
+
+    def run_demos_as_batch(self):
+        """
+        Run the non-interactive demos through the OpenAI Batch API
+
+        Batch jobs complete within 24 hours at roughly half the live
+        per-token price and draw from a separate rate-limit pool, so they
+        fit demos with no latency requirement. The Batch API does not
+        support image generation, so only the chat and embeddings demos
+        are queued
+        """
+        print("\n📦 Batch Demo Mode")
+        print("-" * 30)
+
+        chat_requests = [
+            {
+                "custom_id": "demo-chat-fun-fact",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.ai_client.default_model,
+                    "messages": [
+                        {"role": "user", "content": "Hello! Tell me a fun fact about Python programming."}
+                    ],
+                    "max_tokens": self.ai_client.default_max_tokens
+                }
+            },
+            {
+                "custom_id": "demo-chat-venv",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.ai_client.default_model,
+                    "messages": [
+                        {"role": "system", "content": "You are a helpful coding assistant. Keep responses concise and practical."},
+                        {"role": "user", "content": "How do I create a virtual environment in Python?"}
+                    ],
+                    "max_tokens": self.ai_client.default_max_tokens
+                }
+            }
+        ]
+        embedding_requests = [
+            {
+                "custom_id": "demo-embeddings",
+                "method": "POST",
+                "url": "/v1/embeddings",
+                "body": {
+                    "model": "text-embedding-3-small",
+                    "input": [
+                        "OpenAI provides powerful AI models for developers",
+                        "Embeddings turn text into vectors for semantic search"
+                    ]
+                }
+            }
+        ]
+
+        # Each batch targets a single endpoint, so chat and embeddings
+        # are submitted as separate jobs
+        batches = [
+            self._submit_batch(chat_requests, "/v1/chat/completions"),
+            self._submit_batch(embedding_requests, "/v1/embeddings")
+        ]
+        for batch in batches:
+            self._print_batch_results(batch)
+
+    def _submit_batch(self, batch_requests: List[Dict[str, Any]], endpoint: str):
+        """
+        Upload request lines as a JSONL file and create a batch job
+
+        Args:
+            batch_requests: Request dicts in the Batch API line format
+            endpoint: The API endpoint the batch targets
+
+        Returns:
+            The created batch object
+        """
+        client = self.ai_client.client
+
+        jsonl_path = f"batch_requests{endpoint.replace('/', '_')}.jsonl"
+        with open(jsonl_path, 'w', encoding='utf-8') as f:
+            for request in batch_requests:
+                f.write(json.dumps(request) + "\n")
+
+        with open(jsonl_path, 'rb') as f:
+            input_file = client.files.create(file=f, purpose="batch")
+
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=endpoint,
+            completion_window="24h"
+        )
+        print(f"Submitted batch {batch.id} for {endpoint} ({len(batch_requests)} request(s))")
+        return batch
+
+    def _print_batch_results(self, batch):
+        """
+        Poll a batch until it finishes and print each result line
+
+        Args:
+            batch: The batch object returned by _submit_batch
+        """
+        client = self.ai_client.client
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            print(f"Batch {batch.id}: {batch.status}, checking again in 30s...")
+            time.sleep(30)
+            batch = client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            print(f"Batch {batch.id} ended with status: {batch.status}")
+            return
+
+        output = client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            result = json.loads(line)
+            body = result["response"]["body"]
+            print(f"\nResult for {result['custom_id']}:")
+            if "choices" in body:
+                print(body["choices"][0]["message"]["content"])
+            else:
+                for item in body.get("data", []):
+                    print(f"Embedding vector length: {len(item['embedding'])}")
+
     def interactive_chat(self):
         """Interactive chat session with the AI"""
         print("\n💬 Interactive Chat Mode")
@@ -213,8 +804,12 @@ class OpenAITutorial:
                     break
                 
                 if user_input:
-                    response = self.ai_client.chat_completion(user_input)
-                    print(f"AI: {response}")
+                    # Stream tokens so the user sees output at first-token
+                    # latency instead of waiting for the full completion
+                    print("AI: ", end="", flush=True)
+                    for token in self.ai_client.chat_completion(user_input, stream=True):
+                        print(token, end="", flush=True)
+                    print()
                     
             except KeyboardInterrupt:
                 print("\nGoodbye!")
@@ -225,10 +820,9 @@ class OpenAITutorial:
     def run_all_demos(self):
         """Run all demonstration functions"""
         try:
-            # self.demo_chat_completion()
-            # self.demo_embeddings()
-            # self.demo_image_generation()
-            
+            # Demos run concurrently instead of back-to-back
+            # asyncio.run(self.run_demos_concurrently())
+
             # Ask user if they want to try interactive chat
             # print("\n" + "=" * 50)
             # choice = input("Would you like to try interactive chat? (y/n): ").lower()
@@ -249,16 +843,23 @@ class OpenAITutorial:
 
 def main():
     """Main entry point"""
+    # LOGLEVEL=DEBUG surfaces diagnostics; the default keeps them quiet
+    logging.basicConfig(level=os.getenv("LOGLEVEL", "WARNING"))
+
     print("🚀 Welcome to OpenAI Tutorial!")
     print("=" * 50)
     
     try:
         # Create tutorial instance
         tutorial = OpenAITutorial()
-        
-        # Run all demonstrations
-        tutorial.run_all_demos()
-        
+
+        # --batch routes the non-interactive demos through the Batch API
+        # at ~50% cost; the default path stays synchronous for interactive use
+        if "--batch" in sys.argv:
+            tutorial.run_demos_as_batch()
+        else:
+            tutorial.run_all_demos()
+
     except ValueError as e:
         print(f"Configuration Error: {str(e)}")
         print("Please check your .env file and ensure OPENAI_API_KEY is set")